@@ -12,7 +12,9 @@ Example:
 Args:
 	document (str): An ASCII input file with the document to be spell checked.
 	dictionary (str): An ASCII input file with the dictionary holding the words to be used as reference
-		for spell checking
+		for spell checking. Each line holds one word, optionally followed by whitespace and an integer frequency.
+	--stats: Print word frequency statistics of the document (word counts, misspelling rate, hapax count
+		and the most frequent words) instead of the misspelled words.
 		
 The dictionary file is removed of all punctuation marks and non-words before being used.
 		
@@ -25,7 +27,6 @@ and word characters are set to those defined by the string module in python by d
 """
 
 #Module imports
-import argparse
 import string
 
 class ErrorDictionary(Exception):
@@ -40,8 +41,31 @@ class ErrorDocument(Exception):
 	"""
 	pass
 
-def readDictionaryIntoList(filename):
-	"""Reads in the dictionary file into a string list
+def _splitDictionaryLine(line):
+	"""Splits a line of the dictionary file into the word and its optional frequency column
+	
+	The last column is only treated as a frequency if it is made up of digits alone. Any other line is 
+	returned unchanged as the word, as it was before the frequency column existed (ex: 'New York').
+	
+	Args:
+		line (str): A single line of the dictionary file. Either a bare word or a word followed by whitespace
+			and a non-negative integer frequency (ex: 'document 1520').
+		
+	Returns:
+		tuple: The word (str) and its frequency (int). Frequency is 0 if the line has no frequency column.
+		
+	"""
+	columns = line.rsplit(None, 1)
+	
+	#Only split off the last column if there is something before it and it is a whole number
+	if len(columns) == 2 and columns[1].strip(string.digits) == '':
+		return columns[0].strip(), int(columns[1])
+		
+	return line, 0
+	
+
+def _readDictionaryLines(filename):
+	"""Reads in the dictionary file into a list of lines
 			
 	Args:
 		filename (str): Name of the ASCII input file with the dictionary file to be imported
@@ -51,15 +75,15 @@ def readDictionaryIntoList(filename):
 			file could not be converted to string
 		
 	Returns:
-		list: A list of strings containing each word in the dictionary
+		list: A list of strings containing each line in the dictionary file
 		
 	"""
-	dictionary = [];
+	lines = [];
 	
 	#Try to read the contents of the dictionary into a string list
 	try:
 		with open(filename, 'r') as file:
-			dictionary = file.read().splitlines()
+			lines = file.read().splitlines()
 			
 	except IOError as e:
 		raise ErrorDictionary("Could not open dictionary file")
@@ -69,9 +93,58 @@ def readDictionaryIntoList(filename):
 		#Unexpected error. Just raise.
 		raise
 		
+	return lines
+	
+	
+def readDictionaryIntoList(filename):
+	"""Reads in the dictionary file into a string list
+	
+	Each line holds one word, optionally followed by whitespace and an integer frequency. The frequency
+	column is dropped here; use readDictionaryFrequencies() to keep it.
+			
+	Args:
+		filename (str): Name of the ASCII input file with the dictionary file to be imported
+			
+	Raises:
+		ErrorDictionary: If it could not open the dictionary file or the contents of the document
+			file could not be converted to string
+		
+	Returns:
+		list: A list of strings containing each word in the dictionary
+		
+	"""
+	dictionary = [_splitDictionaryLine(line)[0] for line in _readDictionaryLines(filename)]
+		
 	return dictionary
 
 	
+def readDictionaryFrequencies(filename):
+	"""Reads in the dictionary file into a dictionary mapping each word to its frequency
+	
+	Words without a frequency column are given a frequency of 0. Words listed more than once have 
+	their frequencies added together. Blank lines are skipped.
+			
+	Args:
+		filename (str): Name of the ASCII input file with the dictionary file to be imported
+			
+	Raises:
+		ErrorDictionary: If it could not open the dictionary file or the contents of the document
+			file could not be converted to string
+		
+	Returns:
+		dict: A dictionary with each word in the dictionary file as key and its frequency (int) as value
+		
+	"""
+	frequencies = {}
+	
+	for line in _readDictionaryLines(filename):
+		word, frequency = _splitDictionaryLine(line)
+		if word.strip():
+			frequencies[word] = frequencies.get(word, 0) + frequency
+		
+	return frequencies
+
+	
 def readDocumentIntoString(filename):
 	"""Reads in the document file into a string
 			
@@ -102,6 +175,221 @@ def readDocumentIntoString(filename):
 	return document
 
 	
+class _CountBucket:
+	"""Node of the linked list of counts used by FrequencyCounter. Holds every tracked word with the same count.
+	
+	Attributes:
+		count (int): The count shared by every word in the bucket
+		words (dict): The words in the bucket as keys in insertion order. Values are unused.
+		prev (_CountBucket): The bucket with the next lower count. None for the bucket with the lowest count.
+		next (_CountBucket): The bucket with the next higher count. None for the bucket with the highest count.
+	
+	"""
+	__slots__ = ('count', 'words', 'prev', 'next')
+	
+	def __init__(self, count):
+		self.count = count
+		self.words = {}
+		self.prev = None
+		self.next = None
+		
+
+class FrequencyCounter:
+	"""Counts how often each word occurs while holding at most a fixed number of distinct words in memory.
+	
+	Uses the Space-Saving algorithm: once capacity distinct words are tracked, a new word replaces the
+	tracked word with the lowest count and inherits that count plus one. Counts are exact as long as no
+	word has been replaced. After that they are upper bounds, off by at most the recorded error of each
+	word, and the most frequent words are still found reliably.
+	
+	Words are kept in a stream summary: a linked list of buckets in increasing count order, each holding
+	the words with that count. Adding a word only moves it to the neighbouring bucket and the word to
+	replace is always in the first bucket, so every update takes constant time.
+	
+	Attributes:
+		capacity (int): Maximum number of distinct words tracked at any time
+		total (int): Number of words added to the counter
+		exact (bool): True if no tracked word has been replaced yet and so every count is exact
+	
+	"""
+	
+	def __init__(self, capacity = 10000):
+		"""Initailization of the class
+		
+		Args:
+			capacity (Optional[int]): Maximum number of distinct words tracked at any time. Must be at least 1.
+			
+		Raises:
+			ValueError: If capacity is less than 1
+			
+		"""
+		if capacity < 1:
+			raise ValueError("FrequencyCounter capacity must be at least 1")
+			
+		self.capacity = capacity
+		self.total = 0
+		self.exact = True
+		self._buckets = {}	#Word to the bucket holding its (possibly over estimated) count
+		self._errors = {}	#Word to the maximum amount its count could be over estimated by
+		self._head = None	#Bucket with the lowest count
+		self._tail = None	#Bucket with the highest count
+		
+	def __len__(self):
+		return len(self._buckets)
+		
+	def _insertBucketAfter(self, bucket, count):
+		"""Creates an empty bucket for the count and links it in right after the bucket
+		
+		Args:
+			bucket (_CountBucket): The bucket to link the new bucket after. None to make it the first bucket.
+			count (int): The count of the new bucket
+			
+		Returns:
+			_CountBucket: The new bucket
+			
+		"""
+		new_bucket = _CountBucket(count)
+		new_bucket.prev = bucket
+		
+		if bucket is None:
+			new_bucket.next = self._head
+			self._head = new_bucket
+		else:
+			new_bucket.next = bucket.next
+			bucket.next = new_bucket
+			
+		if new_bucket.next is None:
+			self._tail = new_bucket
+		else:
+			new_bucket.next.prev = new_bucket
+			
+		return new_bucket
+		
+	def _unlinkBucket(self, bucket):
+		"""Removes an empty bucket from the linked list
+		
+		Args:
+			bucket (_CountBucket): The bucket to be removed
+			
+		"""
+		if bucket.prev is None:
+			self._head = bucket.next
+		else:
+			bucket.prev.next = bucket.next
+			
+		if bucket.next is None:
+			self._tail = bucket.prev
+		else:
+			bucket.next.prev = bucket.prev
+		
+	def _increment(self, word, bucket):
+		"""Moves a tracked word from its bucket to the bucket with the next higher count
+		
+		Args:
+			word (str): The word to be moved
+			bucket (_CountBucket): The bucket currently holding the word
+			
+		"""
+		next_bucket = bucket.next
+		if next_bucket is None or next_bucket.count != bucket.count + 1:
+			next_bucket = self._insertBucketAfter(bucket, bucket.count + 1)
+			
+		del bucket.words[word]
+		next_bucket.words[word] = None
+		self._buckets[word] = next_bucket
+		
+		if not bucket.words:
+			self._unlinkBucket(bucket)
+		
+	def add(self, word):
+		"""Counts one occurrence of the word
+		
+		Args:
+			word (str): The word to be counted
+			
+		"""
+		self.total += 1
+		
+		bucket = self._buckets.get(word)
+		if bucket is not None:
+			self._increment(word, bucket)
+			return
+			
+		if len(self._buckets) < self.capacity:
+			#New word starts with a count of 1, which is always the first bucket if it exists
+			bucket = self._head
+			if bucket is None or bucket.count != 1:
+				bucket = self._insertBucketAfter(None, 1)
+			bucket.words[word] = None
+			self._buckets[word] = bucket
+			self._errors[word] = 0
+			return
+			
+		#Counter is full. Replace the oldest word with the lowest count and take over its count as the error.
+		bucket = self._head
+		min_word = next(iter(bucket.words))
+		del bucket.words[min_word]
+		del self._buckets[min_word]
+		del self._errors[min_word]
+		
+		bucket.words[word] = None
+		self._buckets[word] = bucket
+		self._errors[word] = bucket.count
+		self._increment(word, bucket)
+		self.exact = False
+		
+	def count(self, word):
+		"""Returns the count of the word. Returns 0 if the word is not tracked.
+		
+		Args:
+			word (str): The word to be looked up
+			
+		Returns:
+			int: The count of the word. Only an upper bound if the counter is no longer exact.
+			
+		"""
+		bucket = self._buckets.get(word)
+		if bucket is None:
+			return 0
+		return bucket.count
+		
+	def mostCommon(self, n):
+		"""Returns the n most frequent tracked words
+		
+		Args:
+			n (int): Number of words to be returned
+			
+		Returns:
+			list: A list of (word, count) tuples sorted by decreasing count, then by increasing error so words
+				with a guaranteed count come first, and then alphabetically
+			
+		"""
+		most_common = []
+		
+		#Walk the buckets from the highest count down and stop once enough words are found
+		bucket = self._tail
+		while bucket is not None and len(most_common) < n:
+			for word in sorted(bucket.words, key=lambda word: (self._errors[word], word)):
+				most_common.append((word, bucket.count))
+			bucket = bucket.prev
+			
+		return most_common[:n]
+		
+	def hapaxCount(self):
+		"""Returns the number of tracked words known to occur exactly once
+		
+		Words that replaced another word can not be confirmed as occurring once, so the result is a lower 
+		bound if the counter is no longer exact.
+		
+		Returns:
+			int: Number of words seen exactly once
+			
+		"""
+		if self._head is None or self._head.count != 1:
+			return 0
+		return sum(1 for word in self._head.words if self._errors[word] == 0)
+		
+	
 class SpellChecker:
 	"""Performs spell checking given a document and a dictionary.
 
@@ -117,11 +405,11 @@ class SpellChecker:
 		puncturation (str): Series of characters that identify which characters should be removed before
 			identifying words. Default is set to characters identified in string.puncturation.
 		word_characters (str): Series of characters that identify which characters consitute to being part
-			of a word. Default is set to characters identified in string.letters.
+			of a word. Default is set to characters identified in string.ascii_letters.
 	
 	"""
 
-	def __init__(self, document, dictionary, punctuation = string.punctuation, word_characters = string.letters):
+	def __init__(self, document, dictionary, punctuation = string.punctuation, word_characters = string.ascii_letters):
 		"""Initailization of the class
 			
 		Args:
@@ -211,11 +499,11 @@ class SpellChecker:
 			list: New list with punctuation marks removed
 			
 		"""
-		empty_trans_table = string.maketrans("","")	#Empty translation table to make translate delete by default
+		delete_trans_table = str.maketrans("","",self.punctuation)	#Translation table that deletes every punctuation character
 		
 		#Remove all characters in self.punctuation from every entry in the list
 		for index in range(len(input_list)):
-			input_list[index] = input_list[index].translate(empty_trans_table,self.punctuation)	
+			input_list[index] = input_list[index].translate(delete_trans_table)	
 
 		#Filter out the empty entires in the list
 		input_list = list(filter(None,input_list))
@@ -234,12 +522,12 @@ class SpellChecker:
 			
 		"""
 		
-		empty_trans_table = string.maketrans("","")	#Empty translation table to make translate delete by default
+		delete_trans_table = str.maketrans("","",self.word_characters)	#Translation table that deletes every word character
 		
 		for index in range(len(input_list)):
 			
 			#First, we want to remove every word character in the word
-			word_no_letters = input_list[index].translate(empty_trans_table,self.word_characters)
+			word_no_letters = input_list[index].translate(delete_trans_table)
 		
 			#Clear out the entry if the length of the word without word_characters is the same as the length of the original word (ex: string consists of all symbols or numbers)
 			if len(word_no_letters) == len(input_list[index]):
@@ -342,6 +630,120 @@ class SpellChecker:
 			
 		"""
 		
+		self._validateInput()
+				
+		#Input is confirmed correct. Now grab each word in the document and compare agaisnt the dictionary list
+		
+		#First want to clean up the dictionary words to remove not words and punctuation marks
+		clean_dictionary = self._removePunctuation(self.dictionary)
+		clean_dictionary = self._removeNotWords(clean_dictionary)
+		
+		#Then we split the document into words
+		document_list = self._parseDocument()
+
+		#Then perform the spell checking against the clean dictionary
+		bad_words = self._checkWords(document_list, clean_dictionary)
+		
+		return bad_words
+		
+		
+	def statistics(self, top_n = 10, capacity = 10000, frequencies = None):
+		"""Counts every word in the document and reports word frequency statistics in a single pass
+		
+		Words are identified the same way as in check() and are counted in lower case. Word counts are
+		held in a FrequencyCounter so the counting itself holds at most capacity distinct words. The document
+		string and its parsed word list are still held in memory in full, as in check().
+		
+		If the dictionary frequencies are given, the statistics also report how much of the document is 
+		made up of words with a known dictionary frequency and the dictionary frequency of each top word.
+		
+		Args:
+			top_n (Optional[int]): Number of most frequent words to report
+			capacity (Optional[int]): Maximum number of distinct words held in memory while counting
+			frequencies (Optional[dict]): Dictionary words as keys and their frequency (int) as values, as
+				returned by readDictionaryFrequencies(). Words are matched in lower case after removing punctuation.
+
+		Raises:
+			ErrorDictionary: If dictionary is missing or is not a list of strings
+			ErrorDocument: If document could not be converted to string
+		
+		Returns:
+			dict: A dictionary holding the statistics of the document with the following keys:
+				total_words (int): Number of words in the document
+				distinct_words (int): Number of distinct words tracked. Only a lower bound if exact is False.
+				misspelled_words (int): Number of words in the document not found in the dictionary
+				misspelling_rate (float): misspelled_words divided by total_words. 0.0 for an empty document.
+				hapax_count (int): Number of words occurring exactly once. Only a lower bound if exact is False.
+				top_words (list): The top_n most frequent words as (word, count) tuples
+				exact (bool): True if the counts were not affected by the capacity limit
+				frequency_coverage (float): Only if frequencies is given. Share of the words in the document with
+					a dictionary frequency above 0. 0.0 for an empty document.
+				dictionary_frequencies (dict): Only if frequencies is given. Each word in top_words as key and its 
+					dictionary frequency as value. 0 for words without a dictionary frequency.
+			
+		"""
+		
+		self._validateInput()
+		
+		#Clean up the dictionary the same way as check() and store it in lower case for quick look ups
+		clean_dictionary = self._removePunctuation(self.dictionary)
+		clean_dictionary = self._removeNotWords(clean_dictionary)
+		dictionary_set = set(word.lower() for word in clean_dictionary)
+		
+		#Clean up the frequency keys the same way so they match the words found in the document
+		clean_frequencies = {}
+		if frequencies is not None:
+			delete_trans_table = str.maketrans("","",self.punctuation)
+			for word, frequency in frequencies.items():
+				word = word.translate(delete_trans_table).lower()
+				clean_frequencies[word] = clean_frequencies.get(word, 0) + frequency
+		
+		counter = FrequencyCounter(capacity)
+		misspelled_words = 0
+		frequent_words = 0
+		
+		#Count and spell check every word in the same pass over the document
+		for word in self._parseDocument():
+			word = word.lower()
+			counter.add(word)
+			if word not in dictionary_set:
+				misspelled_words += 1
+			if clean_frequencies.get(word, 0) > 0:
+				frequent_words += 1
+				
+		if counter.total > 0:
+			misspelling_rate = float(misspelled_words) / counter.total
+			frequency_coverage = float(frequent_words) / counter.total
+		else:
+			misspelling_rate = 0.0
+			frequency_coverage = 0.0
+		
+		statistics = {
+			'total_words': counter.total,
+			'distinct_words': len(counter),
+			'misspelled_words': misspelled_words,
+			'misspelling_rate': misspelling_rate,
+			'hapax_count': counter.hapaxCount(),
+			'top_words': counter.mostCommon(top_n),
+			'exact': counter.exact,
+		}
+		
+		if frequencies is not None:
+			statistics['frequency_coverage'] = frequency_coverage
+			statistics['dictionary_frequencies'] = dict((word, clean_frequencies.get(word, 0)) for word, count in statistics['top_words'])
+		
+		return statistics
+		
+		
+	def _validateInput(self):
+		"""Checks that the document is a string and the dictionary is a non-empty list of strings
+		
+		Raises:
+			ErrorDictionary: If dictionary is missing or is not a list of strings
+			ErrorDocument: If document could not be converted to string
+			
+		"""
+		
 		#Check if document is a string. If not, return error
 		if not isinstance(self.document, str):
 			raise ErrorDocument("Document is not a string")
@@ -358,20 +760,6 @@ class SpellChecker:
 		for words in self.dictionary:
 			if not isinstance(words, str):
 				raise ErrorDictionary("Dictionary is not a list of strings")
-				
-		#Input is confirmed correct. Now grab each word in the document and compare agaisnt the dictionary list
-		
-		#First want to clean up the dictionary words to remove not words and punctuation marks
-		clean_dictionary = self._removePunctuation(self.dictionary)
-		clean_dictionary = self._removeNotWords(clean_dictionary)
-		
-		#Then we split the document into words
-		document_list = self._parseDocument()
-
-		#Then perform the spell checking against the clean dictionary
-		bad_words = self._checkWords(document_list, clean_dictionary)
-		
-		return bad_words
 	
 	
 def SpellCheckerFromFile(document_path,dictionary_path):
@@ -399,28 +787,100 @@ def SpellCheckerFromFile(document_path,dictionary_path):
 	return bad_words
 
 	
+def StatisticsFromFile(document_path, dictionary_path, top_n = 10, capacity = 10000):
+	"""Attempts to read in the document and dictionary file before computing word frequency statistics
 	
-if __name__ == "__main__":
-	"""Main function of the program. Prints the words from the document not found in the dictionary onto the screan
+	Args:
+		document_path (str): A string containing the path name for the doucment file
+		dictionary_path (str): A string containing the path name for the dictionary file
+		top_n (Optional[int]): Number of most frequent words to report
+		capacity (Optional[int]): Maximum number of distinct words held in memory while counting
+		
+	Returns:
+		dict: The statistics of the document as returned by SpellChecker.statistics() with the dictionary
+			frequencies included
+	
+	"""
+	
+	#Attempt to open dictionary file and store the words and their frequencies. The words make up the dictionary list.
+	frequencies = readDictionaryFrequencies(dictionary_path)
+	dictionary = list(frequencies)
+	
+	#Attempt to open the document file and store the contents in as a string.
+	document = readDocumentIntoString(document_path)
+	
+	#Create an instance of the SpellChecker class and compute the statistics
+	spell_check = SpellChecker(document, dictionary)
+	statistics = spell_check.statistics(top_n, capacity, frequencies)
+	
+	return statistics
+	
+	
+def _positiveInt(value):
+	"""Converts a command line argument into an integer that is at least 1
+	
+	Args:
+		value (str): The command line argument to be converted
+		
+	Raises:
+		argparse.ArgumentTypeError: If the argument is not an integer or is less than 1
+		
+	Returns:
+		int: The argument as an integer
+		
+	"""
+	import argparse
+	
+	try:
+		number = int(value)
+	except ValueError:
+		raise argparse.ArgumentTypeError("invalid positive integer value: " + repr(value))
+		
+	if number < 1:
+		raise argparse.ArgumentTypeError("must be a positive integer: " + repr(value))
+		
+	return number
+	
+	
+def main(argv = None):
+	"""Main function of the program. Prints the words from the document not found in the dictionary onto the screen
+
+	With --stats, prints the word frequency statistics of the document instead.
+
+	argparse is only imported here so that using this module as a library does not pay for it at import time.
 
 	Args:
-		document (str): An ASCII input file with the document to be spell checked.
-		dictionary (str): An ASCII input file with the dictionary holding the words to be used as reference
-			for spell checking
+		argv (Optional[list]): List of command line arguments to parse. Defaults to sys.argv[1:].
 	
 	"""
+	import argparse
 	
 	#General argument parser directing the user how to use this program
 	parser = argparse.ArgumentParser(description='Performs spell checking of a document file and against a dictionary file')
 	parser.add_argument("document", help="Document file to be checked")
-	parser.add_argument("dictionary", help="Dictionary file containing valid words to check against the document file. One dictionary word per line.")
-	args = parser.parse_args()
+	parser.add_argument("dictionary", help="Dictionary file containing valid words to check against the document file. One dictionary word per line, optionally followed by its frequency.")
+	parser.add_argument("--stats", action="store_true", help="Print word frequency statistics of the document instead of the misspelled words")
+	parser.add_argument("--top", type=_positiveInt, default=10, help="Number of most frequent words printed with --stats. Default is 10.")
+	parser.add_argument("--capacity", type=_positiveInt, default=10000, help="Maximum number of distinct words held in memory with --stats. Default is 10000.")
+	args = parser.parse_args(argv)
+	
+	if args.stats:
+		statistics = StatisticsFromFile(args.document, args.dictionary, args.top, args.capacity)
+		
+		#Print out the statistics followed by the most frequent words with their counts and dictionary frequencies
+		for key in ('total_words', 'distinct_words', 'misspelled_words', 'misspelling_rate', 'hapax_count', 'frequency_coverage', 'exact'):
+			print(key + ': ' + str(statistics[key]))
+		for word, count in statistics['top_words']:
+			print(word + ' ' + str(count) + ' ' + str(statistics['dictionary_frequencies'][word]))
+		return
 	
 	#Call subfunction to start the spell checking program
 	bad_words = SpellCheckerFromFile(args.document, args.dictionary)
 	
 	#Print out the list of bad words
 	for words in bad_words:
-		print words
+		print(words)
+		
 		
-		
\ No newline at end of file
+if __name__ == "__main__":
+	main()